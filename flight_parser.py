@@ -1,35 +1,118 @@
 
 import argparse
+import array
+import collections
+import contextlib
 import csv
+import itertools
 import json
+import math
+import mmap
+import operator
 import os
 import re
 import sys
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+_NEWLINE_RE = re.compile(rb'\r\n?|\n')
+_DATETIME_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2}) ([0-9]{2}):([0-9]{2})\Z')
+
+# One rejected CSV line; a tuple keeps large error lists compact
+ErrorRecord = collections.namedtuple('ErrorRecord', ['file', 'line_number', 'raw_line', 'error'])
+
+
+def _dump_json(data):
+    """Serialize data as indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
 
 class FlightParser:
     """Main flight parser class that handles CSV parsing, validation, and querying."""
     
     DATE_FORMAT = "%Y-%m-%d %H:%M"
+    CHUNK_SIZE = 256 * 1024
+    # Files at least this large are memory-mapped instead of read in chunks
+    MMAP_THRESHOLD = 64 * 1024 * 1024
+    # Folders with at least this many bytes of CSV are parsed in worker processes
+    PARALLEL_THRESHOLD = 16 * 1024 * 1024
+    # Query fields matched by equality, which can be served from an index
+    EQUALITY_FIELDS = ('flight_id', 'origin', 'destination')
+    # Relative cost of checking each query field, cheapest predicates run first
+    QUERY_FIELD_COST = {
+        'flight_id': 0,
+        'origin': 0,
+        'destination': 0,
+        'price': 1,
+        'departure_datetime': 2,
+        'arrival_datetime': 2
+    }
     
     def __init__(self):
         self.valid_flights = []
         self.errors = []
+        # Number of errors found, including any streamed to disk instead of kept in errors
+        self.error_count = 0
+        self._error_stream = None
+        self._dt_cache = {}
+        # Query indexes, built lazily and rebuilt after valid_flights changes
+        self._indexes_dirty = True
+        self._indexed_flights = None
+        # Per-field value -> positions indexes, built once a field is queried twice
+        self._equality_indexes = {}
+        self._scanned_fields = set()
+        # Column-wise copies of valid_flights used for query filtering, also built on first use
+        self._columns = {}
         
     def validate_flight_id(self, flight_id):
         """Validate flight_id: 2-8 alphanumeric characters"""
-        return bool(re.match(r'^[A-Za-z0-9]{2,8}$', flight_id))
+        return (2 <= len(flight_id) <= 8 and
+                flight_id.isascii() and flight_id.isalnum())
     
     def validate_airport_code(self, code):
         """Validate airport code: 3 uppercase letters"""
-        return bool(re.match(r'^[A-Z]{3}$', code))
+        return (len(code) == 3 and code.isascii() and
+                code.isalpha() and code.isupper())
+    
+    def _parse_dt(self, datetime_str):
+        """Parse a datetime string, reusing earlier results for repeated values"""
+        parsed = self._dt_cache.get(datetime_str)
+        if parsed is None:
+            parsed = self._parse_dt_fast(datetime_str)
+            if parsed is None:
+                parsed = datetime.strptime(datetime_str, self.DATE_FORMAT)
+            self._dt_cache[datetime_str] = parsed
+        return parsed
+    
+    def _parse_dt_fast(self, s):
+        """Parse the exact YYYY-MM-DD HH:MM layout with a precompiled regex; None if it does not fit"""
+        match = _DATETIME_RE.match(s)
+        if match is None:
+            return None
+        try:
+            return datetime(int(match[1]), int(match[2]), int(match[3]),
+                            int(match[4]), int(match[5]))
+        except ValueError:
+            return None
+    
+    def _to_seconds(self, datetime_str):
+        """Convert a datetime string to whole seconds since 1970-01-01, ignoring timezones"""
+        return (self._parse_dt(datetime_str) - _EPOCH) // _ONE_SECOND
     
     def validate_datetime(self, datetime_str):
         """Validate datetime format: YYYY-MM-DD HH:MM"""
         try:
-            datetime.strptime(datetime_str, self.DATE_FORMAT)
+            self._parse_dt(datetime_str)
             return True
         except ValueError:
             return False
@@ -45,8 +128,8 @@ class FlightParser:
     def validate_times(self, departure_str, arrival_str):
         """Validate that arrival is after departure"""
         try:
-            departure = datetime.strptime(departure_str, self.DATE_FORMAT)
-            arrival = datetime.strptime(arrival_str, self.DATE_FORMAT)
+            departure = self._parse_dt(departure_str)
+            arrival = self._parse_dt(arrival_str)
             return arrival > departure
         except ValueError:
             return False
@@ -66,15 +149,8 @@ class FlightParser:
                 errors.append("extra fields")
             return False, None, errors
         
-        flight_id, origin, destination, departure_dt, arrival_dt, price = record
-        
         # Strip whitespace from all fields
-        flight_id = flight_id.strip()
-        origin = origin.strip()
-        destination = destination.strip()
-        departure_dt = departure_dt.strip()
-        arrival_dt = arrival_dt.strip()
-        price = price.strip()
+        flight_id, origin, destination, departure_dt, arrival_dt, price = map(str.strip, record)
         
         # Validate individual fields
         if not flight_id:
@@ -97,31 +173,41 @@ class FlightParser:
         elif not self.validate_airport_code(destination):
             errors.append("invalid destination code")
         
+        # Parse each datetime once and reuse it for the ordering check
+        departure = arrival = None
         if not departure_dt:
             errors.append("missing departure_datetime")
-        elif not self.validate_datetime(departure_dt):
-            errors.append("invalid departure datetime")
+        else:
+            try:
+                departure = self._parse_dt(departure_dt)
+            except ValueError:
+                errors.append("invalid departure datetime")
         
         if not arrival_dt:
             errors.append("missing arrival_datetime")
-        elif not self.validate_datetime(arrival_dt):
-            errors.append("invalid arrival datetime")
-        elif (self.validate_datetime(departure_dt) and 
-              self.validate_datetime(arrival_dt) and 
-              not self.validate_times(departure_dt, arrival_dt)):
+        else:
+            try:
+                arrival = self._parse_dt(arrival_dt)
+            except ValueError:
+                errors.append("invalid arrival datetime")
+        
+        if departure is not None and arrival is not None and arrival <= departure:
             errors.append("arrival before departure")
         
+        # Convert the price once and reuse it for the stored value
+        price_val = None
         if not price:
             errors.append("missing price")
-        elif not self.validate_price(price):
+        else:
             try:
                 price_val = float(price)
+            except ValueError:
+                errors.append("invalid price format")
+            else:
                 if price_val <= 0:
                     errors.append("price must be positive")
-                else:
+                elif math.isnan(price_val):
                     errors.append("invalid price format")
-            except ValueError:
-                errors.append("invalid price format")
         
         # If any errors, return invalid
         if errors:
@@ -134,40 +220,162 @@ class FlightParser:
             'destination': destination,
             'departure_datetime': departure_dt,
             'arrival_datetime': arrival_dt,
-            'price': round(float(price), 2)
+            'price': round(price_val, 2)
         }
         
         return True, flight_data, []
     
-    def parse_csv_file(self, file_path):
-        """Parse a single CSV file and separate valid/invalid records"""
+    def _read_lines(self, file):
+        """Yield lines of a binary file without line endings"""
+        if os.fstat(file.fileno()).st_size >= self.MMAP_THRESHOLD:
+            return self._read_mapped_lines(file)
+        return self._read_chunked_lines(file)
+    
+    def _read_mapped_lines(self, file):
+        """Yield lines of a memory-mapped binary file, without line endings"""
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            end = len(mapped)
+            start = 0
+            if mapped.find(b'\r') < 0:
+                while start < end:
+                    newline = mapped.find(b'\n', start)
+                    if newline < 0:
+                        newline = end
+                    yield mapped[start:newline]
+                    start = newline + 1
+                return
+            
+            # Accept \r\n, \r and \n line endings like text mode does
+            for newline in _NEWLINE_RE.finditer(mapped):
+                yield mapped[start:newline.start()]
+                start = newline.end()
+            if start < end:
+                yield mapped[start:end]
+    
+    def _read_chunked_lines(self, file):
+        """Yield lines of a binary file read in large chunks, without line endings"""
+        tail = b''
+        while True:
+            chunk = file.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            data = tail + chunk
+            held = b''
+            if b'\r' in data:
+                # A trailing \r may be the first half of a \r\n split across chunks
+                if data.endswith(b'\r'):
+                    data, held = data[:-1], b'\r'
+                # Accept \r\n, \r and \n line endings like text mode does
+                data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            lines = data.split(b'\n')
+            tail = lines.pop() + held
+            yield from lines
+        if tail.endswith(b'\r'):
+            tail = tail[:-1]
+        if tail:
+            yield tail
+    
+    def _read_csv_rows(self, file):
+        """
+        Yield (raw_line, row) pairs from a binary file
+        Plain lines are split directly; lines with quotes go through the csv module
+        """
+        lines = self._read_lines(file)
+        for line in lines:
+            if not line:
+                yield '', []
+            elif b'"' in line:
+                # A quoted field may continue on the following lines
+                raw_lines = [line]
+                
+                def continuation():
+                    for next_line in lines:
+                        raw_lines.append(next_line)
+                        yield next_line.decode('utf-8') + '\n'
+                
+                reader = csv.reader(itertools.chain([line.decode('utf-8') + '\n'], continuation()))
+                row = next(reader)
+                yield b'\n'.join(raw_lines).decode('utf-8'), row
+            else:
+                raw_line = line.decode('utf-8')
+                yield raw_line, raw_line.split(',')
+    
+    def _leading_rows(self, rows):
+        """
+        Consume numbered rows up to the first non-empty, non-comment one
+        Returns the consumed rows, leaving that row out if it is a header
+        """
+        leading = []
+        for line_number, (raw_line, row) in rows:
+            if row and not row[0].strip().startswith('#'):
+                # Skip header row if it matches expected fields
+                if not (len(row) >= 6 and
+                        row[0].lower() == 'flight_id' and
+                        row[1].lower() == 'origin'):
+                    leading.append((line_number, (raw_line, row)))
+                break
+            leading.append((line_number, (raw_line, row)))
+        return leading
+    
+    def _add_error(self, error):
+        """Record an error, writing it straight to the error stream if one is open"""
+        self.error_count += 1
+        if self._error_stream is not None:
+            self._error_stream.write(self._format_error(error))
+        else:
+            self.errors.append(error)
+    
+    @contextlib.contextmanager
+    def _streaming_errors(self, errors_out_path):
+        """
+        Write errors to errors_out_path as they are found instead of keeping them
+        Errors go to a temporary file that only replaces errors_out_path on success
+        and only if any errors were found, matching export_errors
+        """
+        temp_path = f"{errors_out_path}.tmp"
+        errors_before = self.error_count
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as errors_out:
+                self._error_stream = errors_out
+                try:
+                    yield
+                finally:
+                    self._error_stream = None
+        except BaseException:
+            # Leave any previous report untouched if parsing aborts
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+            raise
+        if self.error_count == errors_before:
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, errors_out_path)
+    
+    def parse_csv_file(self, file_path, errors_out_path=None):
+        """
+        Parse a single CSV file and separate valid/invalid records
+        If errors_out_path is given, errors are written there as they are found
+        """
+        if errors_out_path is not None:
+            with self._streaming_errors(errors_out_path):
+                return self.parse_csv_file(file_path)
+        
+        self.invalidate_indexes()
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                line_number = 0
+            with open(file_path, 'rb') as file:
+                rows = enumerate(self._read_csv_rows(file), 1)
                 
-                for row in reader:
-                    line_number += 1
-                    
+                for line_number, (raw_line, row) in itertools.chain(self._leading_rows(rows), rows):
                     # Skip empty lines
                     if not row:
                         continue
                     
                     # Skip comment lines (lines starting with #)
                     if row[0].strip().startswith('#'):
-                        self.errors.append({
-                            'file': file_path,
-                            'line_number': line_number,
-                            'raw_line': ','.join(row),
-                            'error': 'comment line, ignored for data parsing'
-                        })
-                        continue
-                    
-                    # Skip header row if it matches expected fields
-                    if (line_number == 1 and 
-                        len(row) >= 6 and 
-                        row[0].lower() == 'flight_id' and 
-                        row[1].lower() == 'origin'):
+                        self._add_error(ErrorRecord(
+                            file_path, line_number, raw_line,
+                            'comment line, ignored for data parsing'
+                        ))
                         continue
                     
                     # Validate the record
@@ -178,19 +386,25 @@ class FlightParser:
                     if is_valid:
                         self.valid_flights.append(flight_data)
                     else:
-                        self.errors.append({
-                            'file': file_path,
-                            'line_number': line_number,
-                            'raw_line': ','.join(row),
-                            'error': '; '.join(errors)
-                        })
+                        self._add_error(ErrorRecord(
+                            file_path, line_number, raw_line, '; '.join(errors)
+                        ))
                         
         except Exception as e:
             print(f"Error reading file {file_path}: {e}")
             sys.exit(1)
     
-    def parse_csv_folder(self, folder_path):
-        """Parse all CSV files in a folder"""
+    def parse_csv_folder(self, folder_path, errors_out_path=None):
+        """
+        Parse all CSV files in a folder
+        If errors_out_path is given, errors are written there as they are found;
+        files parsed in worker processes have their errors written once each file is done
+        """
+        if errors_out_path is not None:
+            with self._streaming_errors(errors_out_path):
+                return self.parse_csv_folder(folder_path)
+        
+        self.invalidate_indexes()
         folder = Path(folder_path)
         
         if not folder.exists():
@@ -203,9 +417,26 @@ class FlightParser:
             print(f"No CSV files found in {folder_path}")
             return
         
-        for csv_file in sorted(csv_files):
-            print(f"Parsing {csv_file}...")
-            self.parse_csv_file(csv_file)
+        csv_files.sort()
+        total_size = sum(csv_file.stat().st_size for csv_file in csv_files)
+        if len(csv_files) == 1 or total_size < self.PARALLEL_THRESHOLD:
+            for csv_file in csv_files:
+                print(f"Parsing {csv_file}...")
+                self.parse_csv_file(csv_file)
+            return
+        
+        # Files are independent, so parse them in separate processes
+        with ProcessPoolExecutor() as executor:
+            futures = []
+            for csv_file in csv_files:
+                # Flush so forked workers do not inherit and repeat buffered output
+                print(f"Parsing {csv_file}...", flush=True)
+                futures.append(executor.submit(_parse_csv_file_worker, csv_file))
+            for future in futures:
+                valid_flights, errors = future.result()
+                self.valid_flights.extend(valid_flights)
+                for error in errors:
+                    self._add_error(error)
     
     def export_valid_flights(self, output_path):
         """Export valid flights to JSON file"""
@@ -213,28 +444,32 @@ class FlightParser:
             print("No valid flights to export")
             return
             
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.valid_flights, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(_dump_json(self.valid_flights))
         print(f"Exported {len(self.valid_flights)} valid flights to {output_path}")
     
+    def _format_error(self, error):
+        """Format a single error as a line of the error report"""
+        _, line_number, line_content, message = error
+        # Handle comment lines specially
+        if 'comment line' in message:
+            return f"Line {line_number}: {line_content} → comment line, ignored for data parsing\n"
+        return f"Line {line_number}: {line_content} → {message}\n"
+    
     def export_errors(self, output_path="errors.txt"):
         """Export error information to text file"""
         if not self.errors:
             print("No errors to export")
             return
             
+        # Write the whole report at once
         with open(output_path, 'w', encoding='utf-8') as f:
-            for error in self.errors:
-                line_content = error['raw_line']
-                # Handle comment lines specially
-                if 'comment line' in error['error']:
-                    f.write(f"Line {error['line_number']}: {line_content} → comment line, ignored for data parsing\n")
-                else:
-                    f.write(f"Line {error['line_number']}: {line_content} → {error['error']}\n")
+            f.write(''.join(map(self._format_error, self.errors)))
         print(f"Exported {len(self.errors)} errors to {output_path}")
     
     def load_json_database(self, json_path):
         """Load existing JSON database"""
+        self.invalidate_indexes()
         try:
             with open(json_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -296,57 +531,144 @@ class FlightParser:
             print(f"Error loading JSON database: {e}")
             sys.exit(1)
     
-    def execute_query(self, query):
-        """Execute a single query on flights"""
-        matches = []
+    def invalidate_indexes(self):
+        """Mark query indexes stale; call after editing valid_flights in place"""
+        self._indexes_dirty = True
+    
+    def _build_indexes(self):
+        """
+        Reset query indexes and columns if valid_flights changed since the last build
+        Stale when flights were parsed or loaded, or valid_flights was reassigned
+        """
+        if not self._indexes_dirty and self._indexed_flights is self.valid_flights:
+            return
+        
+        self._indexes_dirty = False
+        self._indexed_flights = self.valid_flights
+        self._equality_indexes = {}
+        self._scanned_fields = set()
+        self._columns = {}
+    
+    def _equality_index(self, field):
+        """
+        Return the value -> flight positions index for field, or None on its first query
+        One query is cheaper to answer with a column scan than by building the index
+        """
+        index = self._equality_indexes.get(field)
+        if index is None:
+            if field not in self._scanned_fields:
+                self._scanned_fields.add(field)
+                return None
+            index = {}
+            for i, flight in enumerate(self._indexed_flights):
+                index.setdefault(flight[field], []).append(i)
+            self._equality_indexes[field] = index
+        return index
+    
+    def _column(self, field):
+        """
+        Return the column of values for field, building it on first use
+        Datetimes are stored as seconds since 1970-01-01 (naive, no timezone)
+        """
+        column = self._columns.get(field)
+        if column is None:
+            flights = self._indexed_flights
+            if field in self.EQUALITY_FIELDS:
+                column = [flight[field] for flight in flights]
+            elif field == 'price':
+                column = array.array('d', (flight['price'] for flight in flights))
+            else:
+                column = array.array('q', (self._to_seconds(flight[field]) for flight in flights))
+            self._columns[field] = column
+        return column
+    
+    def _query_predicates(self, query):
+        """
+        Translate a query into (field, comparison, value) predicates
+        Returns None if the query can never match
+        """
+        predicates = []
         
-        for flight in self.valid_flights:
-            match = True
+        # Equality checks, then price, then datetime comparisons
+        fields = sorted(query, key=lambda field: self.QUERY_FIELD_COST.get(field, 0))
+        for field in fields:
+            value = query[field]
+            if field in self.EQUALITY_FIELDS:
+                predicates.append((field, operator.eq, value))
             
-            for field, value in query.items():
-                if field == 'flight_id':
-                    if flight.get('flight_id') != value:
-                        match = False
-                        break
-                
-                elif field == 'origin':
-                    if flight.get('origin') != value:
-                        match = False
-                        break
-                
-                elif field == 'destination':
-                    if flight.get('destination') != value:
-                        match = False
-                        break
-                
-                elif field == 'departure_datetime':
-                    flight_dt = datetime.strptime(flight['departure_datetime'], self.DATE_FORMAT)
-                    query_dt = datetime.strptime(value, self.DATE_FORMAT)
-                    if flight_dt < query_dt:
-                        match = False
-                        break
-                
-                elif field == 'arrival_datetime':
-                    flight_dt = datetime.strptime(flight['arrival_datetime'], self.DATE_FORMAT)
-                    query_dt = datetime.strptime(value, self.DATE_FORMAT)
-                    if flight_dt > query_dt:
-                        match = False
-                        break
-                
-                elif field == 'price':
-                    try:
-                        query_price = float(value)
-                        if flight.get('price') > query_price:
-                            match = False
-                            break
-                    except ValueError:
-                        match = False
-                        break
+            elif field in ('departure_datetime', 'arrival_datetime'):
+                try:
+                    query_seconds = self._to_seconds(value)
+                except ValueError:
+                    return None
+                if field == 'departure_datetime':
+                    predicates.append((field, operator.ge, query_seconds))
+                else:
+                    predicates.append((field, operator.le, query_seconds))
             
-            if match:
-                matches.append(flight)
+            elif field == 'price':
+                try:
+                    query_price = float(value)
+                except ValueError:
+                    return None
+                # A NaN limit never compares lower than a price, so it filters nothing
+                if not math.isnan(query_price):
+                    predicates.append((field, operator.le, query_price))
+        
+        return predicates
+    
+    def _compile_query(self, query):
+        """
+        Bind a query's index lookup and constants into a function returning its matches
+        Uses the indexes from the last _build_indexes call
+        """
+        flights = self._indexed_flights
+        if not flights:
+            return list
         
-        return matches
+        predicates = self._query_predicates(query)
+        if predicates is None:
+            return list
+        
+        # Start from the smallest index bucket of the queried equality fields
+        candidates = range(len(flights))
+        bucket_field = None
+        for field, value in query.items():
+            if field in self.EQUALITY_FIELDS:
+                index = self._equality_index(field)
+                if index is None:
+                    continue
+                try:
+                    bucket = index.get(value, [])
+                except TypeError:
+                    return list
+                if len(bucket) < len(candidates):
+                    candidates = bucket
+                    bucket_field = field
+        
+        # Every flight in the bucket already matches its own field
+        checks = [(self._column(field), compare, value)
+                  for field, compare, value in predicates
+                  if field != bucket_field]
+        
+        def run():
+            matches = candidates
+            # Narrow the candidates one column at a time
+            for column, compare, value in checks:
+                if not matches:
+                    break
+                values = map(column.__getitem__, matches)
+                matches = list(itertools.compress(
+                    matches, map(compare, values, itertools.repeat(value))
+                ))
+            return list(map(flights.__getitem__, matches))
+        
+        return run
+    
+    def execute_query(self, query):
+        """Execute a single query on flights"""
+        self._build_indexes()
+        return self._compile_query(query)()
     
     def execute_queries_from_file(self, query_file_path):
         """Execute queries from JSON file"""
@@ -362,12 +684,14 @@ class FlightParser:
             else:
                 raise ValueError("Query file should contain an object or array of objects")
             
+            # Index once for the whole batch, then compile every query before running them
+            self._build_indexes()
+            compiled = [self._compile_query(query) for query in queries]
             results = []
-            for query in queries:
-                matches = self.execute_query(query)
+            for query, run in zip(queries, compiled):
                 results.append({
                     "query": query,
-                    "matches": matches
+                    "matches": run()
                 })
             
             return results
@@ -381,13 +705,20 @@ class FlightParser:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         filename = f"response_{student_id}_{first_name}_{last_name}_{timestamp}.json"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_dump_json(results))
         
         print(f"Query results saved to {filename}")
         return filename
 
 
+def _parse_csv_file_worker(file_path):
+    """Parse a single CSV file in a worker process"""
+    flight_parser = FlightParser()
+    flight_parser.parse_csv_file(file_path)
+    return flight_parser.valid_flights, flight_parser.errors
+
+
 def main():
     """Main function to handle command-line arguments and coordinate parsing"""
     parser = argparse.ArgumentParser(
@@ -455,17 +786,21 @@ def main():
         flight_parser.load_json_database(args.json)
         
     elif args.input or args.directory:
-        # Parse CSV files
+        # Parse CSV files, writing errors out as they are found
+        errors_path = "errors.txt"
         if args.input:
             print(f"Parsing CSV file: {args.input}")
-            flight_parser.parse_csv_file(args.input)
+            flight_parser.parse_csv_file(args.input, errors_out_path=errors_path)
         elif args.directory:
             print(f"Parsing CSV folder: {args.directory}")
-            flight_parser.parse_csv_folder(args.directory)
+            flight_parser.parse_csv_folder(args.directory, errors_out_path=errors_path)
         
         # Export results
         flight_parser.export_valid_flights(args.output)
-        flight_parser.export_errors()
+        if flight_parser.error_count:
+            print(f"Exported {flight_parser.error_count} errors to {errors_path}")
+        else:
+            print("No errors to export")
         
     # Execute queries if requested
     if args.query: